@@ -16,45 +16,77 @@ try:
     from cryptography import x509
     from cryptography.x509.oid import NameOID
     HAS_CRYPTOGRAPHY = True
+    # not_valid_after_utc replaces the deprecated naive getters in cryptography >= 42.0
+    HAS_UTC_VALIDITY = hasattr(x509.Certificate, 'not_valid_after_utc')
 except ImportError:
     HAS_CRYPTOGRAPHY = False
-
-SUPPORTED_EXTENSIONS = {
-    'basicConstraints': [
-        '_ca',
-        '_path_length'
-    ],
-    'subjectKeyIdentifier': [
-        '_digest'
-    ],
-    'authorityKeyIdentifier': [
-        '_authority_cert_issuer',
-        '_authority_cert_serial_number',
-        '_key_identifier'
-    ]
-}
+    HAS_UTC_VALIDITY = False
 
 
 def bytes_to_hex(bytes_str):
     """Convert bytes to a colon-separated hex string (e.g. 'AB:CD:EF')."""
-    return ':'.join('%02X' % b for b in bytes_str)
+    return bytes_str.hex(':').upper()
+
+
+def _attribute(name):
+    """Return a reader for a public attribute of an extension value."""
+    def read(value):
+        return getattr(value, name)
+    return read
+
+
+def _hex_attribute(name):
+    """Return a reader for a bytes attribute, formatted with bytes_to_hex()."""
+    def read(value):
+        raw = getattr(value, name)
+        return bytes_to_hex(raw) if raw is not None else None
+    return read
+
+
+# Supported extensions, mapping each returned key to the reader for its value.
+SUPPORTED_EXTENSIONS = {
+    'basicConstraints': {
+        '_ca': _attribute('ca'),
+        '_path_length': _attribute('path_length')
+    },
+    'subjectKeyIdentifier': {
+        '_digest': _hex_attribute('digest')
+    },
+    'authorityKeyIdentifier': {
+        '_authority_cert_issuer': _attribute('authority_cert_issuer'),
+        '_authority_cert_serial_number': _attribute('authority_cert_serial_number'),
+        '_key_identifier': _hex_attribute('key_identifier')
+    }
+}
 
 
 def check_supported_extensions(extension_name):
-    """Return True if extension_name matches a supported extension."""
-    return any(name in extension_name for name in SUPPORTED_EXTENSIONS)
+    """Return True if extension_name is a supported extension."""
+    return extension_name in SUPPORTED_EXTENSIONS
 
 
 def check_supported_keys(key, extension_name):
     """Return True if key is a supported key for the given extension."""
-    return key in SUPPORTED_EXTENSIONS.get(extension_name, [])
+    return key in SUPPORTED_EXTENSIONS.get(extension_name, {})
 
 
 class AnalyzeCertificate():
+    __slots__ = (
+        'module',
+        'result',
+        '__passphrase',
+        '__path',
+        '__format',
+        '__cert',
+        '__private_key',
+        '__additional_certs'
+    )
+
     def __init__(self, module, result):
         self.module = module
         self.result = result
-        self.__passphrase = self.module.params['passphrase']
+        passphrase = self.module.params['passphrase']
+        self.__passphrase = to_bytes(passphrase) if passphrase is not None else None
         self.__path = self.module.params['path']
         self.__format = self.module.params.get('format', 'p12')
         self.__cert = None
@@ -86,7 +118,7 @@ class AnalyzeCertificate():
         try:
             pkcs12_tuple = pkcs12.load_key_and_certificates(
                 data,
-                to_bytes(self.__passphrase),
+                self.__passphrase,
             )
         except ValueError as e:
             self.module.fail_json(
@@ -110,24 +142,20 @@ class AnalyzeCertificate():
         self.extensions_info()
 
     def general_info(self):
-        issuer_attrs = self.__cert.issuer.get_attributes_for_oid(
-            NameOID.COMMON_NAME
-        )
-        subject_attrs = self.__cert.subject.get_attributes_for_oid(
-            NameOID.COMMON_NAME
-        )
+        cert = self.__cert
+        issuer_attrs = cert.issuer.get_attributes_for_oid(NameOID.COMMON_NAME)
+        subject_attrs = cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
 
         self.result['issuer'] = to_text(issuer_attrs[0].value) if issuer_attrs else ''
         self.result['subject'] = to_text(subject_attrs[0].value) if subject_attrs else ''
-        # Use not_valid_after_utc to avoid deprecation warning (cryptography >= 42.0)
-        if hasattr(self.__cert, 'not_valid_after_utc'):
-            self.result['not_valid_after'] = to_text(self.__cert.not_valid_after_utc)
-            self.result['not_valid_before'] = to_text(self.__cert.not_valid_before_utc)
+        if HAS_UTC_VALIDITY:
+            self.result['not_valid_after'] = to_text(cert.not_valid_after_utc)
+            self.result['not_valid_before'] = to_text(cert.not_valid_before_utc)
         else:
-            self.result['not_valid_after'] = to_text(self.__cert.not_valid_after)
-            self.result['not_valid_before'] = to_text(self.__cert.not_valid_before)
-        self.result['serial_number'] = to_text(self.__cert.serial_number)
-        self.result['version'] = to_text(self.__cert.version)
+            self.result['not_valid_after'] = to_text(cert.not_valid_after)
+            self.result['not_valid_before'] = to_text(cert.not_valid_before)
+        self.result['serial_number'] = to_text(cert.serial_number)
+        self.result['version'] = to_text(cert.version)
 
     def extensions_info(self):
         for extension in self.__cert.extensions:
@@ -150,12 +178,10 @@ class AnalyzeCertificate():
 
     def _load_extension_values(self, name, extension):
         self.result['extensions'][name]['_values'] = dict()
-        for key, value in vars(extension.value).items():
-            if not check_supported_keys(key, name):
-                continue
-            if isinstance(value, bytes):
-                value = bytes_to_hex(value)
-            self.result['extensions'][name]['_values'][to_text(key)] = to_text(value)
+        for key, read in SUPPORTED_EXTENSIONS[name].items():
+            self.result['extensions'][name]['_values'][to_text(key)] = to_text(
+                read(extension.value)
+            )
 
     def return_result(self):
         return self.result
@@ -12,10 +12,6 @@ __metaclass__ = type
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_native
 
-from ansible_collections.oddly.elasticstack.plugins.module_utils.certs import (
-    AnalyzeCertificate
-)
-
 
 def run_module():
     module_args = dict(
@@ -46,6 +42,11 @@ def run_module():
     if module.check_mode:
         module.exit_json(**result)
 
+    # imported here so check mode does not pay for loading cryptography
+    from ansible_collections.oddly.elasticstack.plugins.module_utils.certs import (
+        AnalyzeCertificate
+    )
+
     try:
         cert_info = AnalyzeCertificate(module, result)
         result = cert_info.return_result()
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+COLLECTION_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def _collections_path():
+    """Return the directory that contains ansible_collections/oddly/elasticstack."""
+    # <path>/ansible_collections/oddly/elasticstack
+    if COLLECTION_ROOT.split(os.sep)[-3:] == ['ansible_collections', 'oddly', 'elasticstack']:
+        return os.path.dirname(os.path.dirname(os.path.dirname(COLLECTION_ROOT)))
+
+    pytest.exit(
+        "The unit tests import the collection as ansible_collections.oddly.elasticstack, "
+        "but %s is not inside an ansible_collections/oddly/elasticstack directory. "
+        "Install the collection (e.g. copy it to "
+        "<path>/ansible_collections/oddly/elasticstack) and run pytest from there."
+        % COLLECTION_ROOT,
+        returncode=pytest.ExitCode.USAGE_ERROR
+    )
+
+
+COLLECTIONS_PATH = _collections_path()
+if COLLECTIONS_PATH not in sys.path:
+    sys.path.insert(0, COLLECTIONS_PATH)
+
+
+def pytest_report_header(config):
+    return 'oddly.elasticstack under test: %s' % COLLECTION_ROOT
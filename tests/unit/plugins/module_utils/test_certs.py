@@ -1,12 +1,48 @@
+import datetime
+import os
+import tempfile
 import unittest
-import sys
-sys.path.append('/home/runner/.ansible/collections/')
+from unittest.mock import MagicMock
 from ansible_collections.oddly.elasticstack.plugins.module_utils.certs import (
+    AnalyzeCertificate,
     check_supported_extensions,
     check_supported_keys,
     bytes_to_hex
 )
 from binascii import unhexlify
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+
+def write_pem_certificate(path):
+    """Write a self-signed certificate whose extensions carry non-None values."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'Test CA')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(1)
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=2), critical=True)
+        .add_extension(x509.SubjectKeyIdentifier(b'\xab\xcd'), critical=False)
+        .add_extension(
+            x509.AuthorityKeyIdentifier(
+                key_identifier=b'\x01\x02',
+                authority_cert_issuer=[x509.DNSName('ca.example.com')],
+                authority_cert_serial_number=5
+            ),
+            critical=False
+        )
+        .sign(key, hashes.SHA256())
+    )
+    with open(path, 'wb') as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
 
 
 class TestCerts(unittest.TestCase):
@@ -30,6 +66,10 @@ class TestCerts(unittest.TestCase):
         #print("Extension is supported: " + str(result))
         self.assertEqual(result, False)
 
+    def test_check_supported_extensions_with_decorated_extension_name(self):
+        result = check_supported_extensions(extension_name='xsubjectKeyIdentifier')
+        self.assertEqual(result, False)
+
     def test_check_supported_keys_with_known_key(self):
         result = check_supported_keys(key='_key_identifier', extension_name='authorityKeyIdentifier')
         #print("Key is supported: " + str(result))
@@ -41,5 +81,32 @@ class TestCerts(unittest.TestCase):
         self.assertEqual(result, False)
 
 
+
+class TestAnalyzeCertificate(unittest.TestCase):
+    def test_extension_values_with_non_default_values(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = os.path.join(tmpdir.name, 'test-ca.crt')
+        write_pem_certificate(path)
+
+        module = MagicMock()
+        module.params = {'path': path, 'passphrase': None, 'format': 'pem'}
+        result = AnalyzeCertificate(module, dict(extensions=dict())).return_result()
+
+        self.assertEqual(result['extensions']['basicConstraints']['_values'], {
+            '_ca': 'True',
+            '_path_length': '2'
+        })
+        self.assertEqual(result['extensions']['subjectKeyIdentifier']['_values'], {
+            '_digest': 'AB:CD'
+        })
+        self.assertEqual(result['extensions']['authorityKeyIdentifier']['_values'], {
+            '_authority_cert_issuer': "[<DNSName(value='ca.example.com')>]",
+            '_authority_cert_serial_number': '5',
+            '_key_identifier': '01:02'
+        })
+        module.warn.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,10 +1,11 @@
 import json
-import sys
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 from ansible.module_utils import basic
 from ansible.module_utils.common.text.converters import to_bytes
-sys.path.append('/home/runner/.ansible/collections/')
+from cryptography.hazmat.primitives.serialization import NoEncryption, pkcs12
 from ansible_collections.oddly.elasticstack.plugins.modules import cert_info
 
 certificate = {
@@ -126,6 +127,26 @@ class TestCertInfo(unittest.TestCase):
             })
             cert_info.main()
 
+    def test_module_exit_when_password_missing_and_not_required(self):
+        # re-export the CA without encryption, so no passphrase is needed
+        with open('molecule/plugins/files/es-ca/elastic-stack-ca.p12', 'rb') as f:
+            key, cert, additional_certs = pkcs12.load_key_and_certificates(
+                f.read(), b'PleaseChangeMe'
+            )
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = os.path.join(tmpdir.name, 'unencrypted-ca.p12')
+        with open(path, 'wb') as f:
+            f.write(pkcs12.serialize_key_and_certificates(
+                None, key, cert, additional_certs, NoEncryption()
+            ))
+
+        with self.assertRaises(AnsibleExitJson):
+            set_module_args({
+                'path': path
+            })
+            cert_info.main()
+
     def test_module_exit_when_path_and_password_correct(self):
         with self.assertRaises(AnsibleExitJson):
             set_module_args({